@@ -0,0 +1,68 @@
+"""AST visitor for the SQL injection check.
+
+This is the innermost hot loop of check_sql_injection.py, so it lives
+in its own module with precise type annotations: the class is
+mypyc-clean and can be compiled to a C extension if the stack ever
+grows a build step. The hooks run it as plain Python today, since this
+repo ships scripts rather than wheels.
+"""
+
+import ast
+from typing import List
+
+# Module-level frozenset: O(1) membership and no list rebuilt on every
+# call-node visit.
+_FORMAT_METHODS = frozenset({"format", "replace"})
+
+
+class SQLInjectionChecker(ast.NodeVisitor):
+    """AST visitor to detect SQL injection vulnerabilities."""
+
+    def __init__(self, filepath: str):
+        """Initialize checker with filepath."""
+        self.filepath = filepath
+        self.issues: List[str] = []
+
+    def visit_Module(self, node: ast.Module) -> None:
+        """Visit the module body, skipping the docstring statement."""
+        body = node.body
+        if (
+            body
+            and isinstance(body[0], ast.Expr)
+            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)
+        ):
+            body = body[1:]
+        for stmt in body:
+            self.visit(stmt)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Check function calls for SQL injection patterns."""
+        # Check for cr.execute() calls (Odoo database cursor)
+        if not isinstance(node.func, ast.Attribute):
+            self.generic_visit(node)
+            return
+
+        if node.func.attr == "execute" and len(node.args) > 0:
+            first_arg = node.args[0]
+
+            # Check for string formatting in SQL
+            if isinstance(first_arg, (ast.BinOp, ast.JoinedStr)):
+                # String concatenation or f-strings
+                self.issues.append(
+                    f"{self.filepath}:{node.lineno}: "
+                    "Potential SQL injection: "
+                    "SQL string uses concatenation or f-string. "
+                    "Use parameterized queries instead."
+                )
+            elif isinstance(first_arg, ast.Call):
+                if isinstance(first_arg.func, ast.Attribute):
+                    if first_arg.func.attr in _FORMAT_METHODS:
+                        self.issues.append(
+                            f"{self.filepath}:{node.lineno}: "
+                            "Potential SQL injection: "
+                            "SQL string uses .format() or .replace(). "
+                            "Use parameterized queries with %s placeholders."
+                        )
+
+        self.generic_visit(node)
@@ -0,0 +1,92 @@
+"""On-disk result cache shared by the pre-commit check scripts.
+
+Entries are keyed by a fast content hash, so warm runs over unchanged
+files collapse to a read + hash + lookup instead of a full re-parse.
+The cache lives in a single SQLite database opened in WAL mode, which
+lets the parallel scan workers share it without blocking each other.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import xxhash  # ~10 GB/s hashing; optional speed-up
+except ImportError:
+    xxhash = None
+
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "pre-commit-stack"
+)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results ("
+    "namespace TEXT NOT NULL, "
+    "key TEXT NOT NULL, "
+    "value TEXT NOT NULL, "
+    "PRIMARY KEY (namespace, key))"
+)
+
+
+def hash_content(content: bytes) -> str:
+    """Return a fast, stable hex digest of file content.
+
+    Uses xxhash (xxh3, ~10 GB/s) when available and falls back to
+    blake2b from the standard library otherwise.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64(content).hexdigest()
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+class ResultCache:
+    """Content-addressed cache of per-file check results.
+
+    Values must be JSON-serializable. A broken or unwritable cache
+    degrades to a miss rather than failing the check.
+    """
+
+    def __init__(self, namespace: str):
+        """Open (creating if needed) the shared cache database."""
+        self.namespace = namespace
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                _CACHE_DIR / "results.db", timeout=5.0
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None on a miss."""
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for key, silently dropping it on cache errors."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (namespace, key, value) "
+                "VALUES (?, ?, ?)",
+                (self.namespace, key, json.dumps(value)),
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
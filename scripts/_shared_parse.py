@@ -0,0 +1,32 @@
+"""Shared, memoized Python parsing for the pre-commit scripts.
+
+Any check that walks a file's AST should go through get_tree: trees
+are cached per (path, mtime), so when several checks — or a unified
+runner hosting them — look at the same file, the parse cost is paid
+once instead of once per check.
+"""
+
+import ast
+import functools
+import os
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=512)
+def _parse(filepath: str, _mtime_ns: int) -> ast.Module:
+    source = Path(filepath).read_bytes().decode("utf-8")
+    # compile() with PyCF_ONLY_AST skips the type-comment handling
+    # ast.parse would do; dont_inherit keeps caller compile flags from
+    # leaking into the parse.
+    return compile(
+        source,
+        filepath,
+        "exec",
+        flags=ast.PyCF_ONLY_AST,
+        dont_inherit=True,
+    )
+
+
+def get_tree(filepath: str) -> ast.Module:
+    """Return the parsed AST of a file, cached by path and mtime."""
+    return _parse(filepath, os.stat(filepath).st_mtime_ns)
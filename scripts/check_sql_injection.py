@@ -5,48 +5,53 @@ This script analyzes Python code (especially Odoo modules) for unsafe SQL
 construction patterns that could lead to SQL injection attacks.
 """
 
-import ast
-import re
+import mmap
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
-
-
-class SQLInjectionChecker(ast.NodeVisitor):
-    """AST visitor to detect SQL injection vulnerabilities."""
-
-    def __init__(self, filepath: str):
-        """Initialize checker with filepath."""
-        self.filepath = filepath
-        self.issues: List[str] = []
-
-    def visit_Call(self, node: ast.Call) -> None:
-        """Check function calls for SQL injection patterns."""
-        # Check for cr.execute() calls (Odoo database cursor)
-        if isinstance(node.func, ast.Attribute):
-            if node.func.attr == "execute" and len(node.args) > 0:
-                first_arg = node.args[0]
-
-                # Check for string formatting in SQL
-                if isinstance(first_arg, (ast.BinOp, ast.JoinedStr)):
-                    # String concatenation or f-strings
-                    self.issues.append(
-                        f"{self.filepath}:{node.lineno}: "
-                        "Potential SQL injection: "
-                        "SQL string uses concatenation or f-string. "
-                        "Use parameterized queries instead."
-                    )
-                elif isinstance(first_arg, ast.Call):
-                    if isinstance(first_arg.func, ast.Attribute):
-                        if first_arg.func.attr in ["format", "replace"]:
-                            self.issues.append(
-                                f"{self.filepath}:{node.lineno}: "
-                                "Potential SQL injection: "
-                                "SQL string uses .format() or .replace(). "
-                                "Use parameterized queries with %s placeholders."
-                            )
-
-        self.generic_visit(node)
+from typing import Iterator, List, Optional, Union
+
+from _checker import SQLInjectionChecker
+from _result_cache import ResultCache, hash_content
+from _shared_parse import get_tree
+
+# Below this size the mmap setup overhead exceeds what it saves.
+_MMAP_MIN_SIZE = 4096
+
+
+@contextmanager
+def _open_source(filepath: str) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Yield file content as a bytes-like view.
+
+    Larger files are memory-mapped so the substring gate and content
+    hash run against the page cache without copying; tiny files are
+    read directly.
+    """
+    with Path(filepath).open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_MIN_SIZE:
+            yield f.read()
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                yield buf
+
+
+# Bump the version suffix whenever checker logic changes, so stale
+# results from an older checker are not replayed from the cache.
+_CACHE_NAMESPACE = "sqlinj-v2"
+
+# Created lazily so each scan worker opens its own SQLite connection
+# instead of inheriting one across fork.
+_result_cache: Optional[ResultCache] = None
+
+
+def _get_result_cache() -> ResultCache:
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(_CACHE_NAMESPACE)
+    return _result_cache
 
 
 def check_python_file(filepath: str) -> tuple[bool, List[str]]:
@@ -59,47 +64,30 @@ def check_python_file(filepath: str) -> tuple[bool, List[str]]:
         Tuple of (is_safe, issues) where is_safe is True if no issues found
     """
     try:
-        content = Path(filepath).read_text(encoding="utf-8")
+        with _open_source(filepath) as raw:
+            # Most Odoo files contain no cursor calls at all;
+            # everything the visitor flags sits inside a .execute()
+            # call, so a single bytes-level scan (memmem under the
+            # hood) skips decoding, hashing and parsing for them.
+            if raw.find(b".execute") == -1:
+                return True, []
+
+            # Skip all parsing when this exact content was checked
+            cache = _get_result_cache()
+            cache_key = f"{filepath}:{hash_content(raw)}"
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached[0], cached[1]
 
-        # Quick regex check for common patterns
         issues = []
 
-        # Pattern 1: String formatting in execute()
-        pattern_format = re.compile(
-            r'\.execute\(["\'].*?%(?!s).*?["\']', re.DOTALL
-        )
-        if pattern_format.search(content):
-            issues.append(
-                f"{filepath}: "
-                "Detected string formatting in SQL execute() call. "
-                "Use parameterized queries."
-            )
-
-        # Pattern 2: f-strings in SQL (very dangerous)
-        pattern_fstring = re.compile(
-            r'\.execute\(f["\'].*?\{.*?\}.*?["\']', re.DOTALL
-        )
-        if pattern_fstring.search(content):
-            issues.append(
-                f"{filepath}: "
-                "CRITICAL: f-string used in SQL execute() call. "
-                "This is a SQL injection vulnerability!"
-            )
-
-        # Pattern 3: String concatenation with +
-        pattern_concat = re.compile(
-            r'\.execute\([^)]*\+[^)]*\)', re.DOTALL
-        )
-        if pattern_concat.search(content):
-            issues.append(
-                f"{filepath}: "
-                "String concatenation detected in SQL execute(). "
-                "Use parameterized queries."
-            )
-
-        # AST-based deep analysis
+        # AST-based analysis; the visitor covers formatting, f-strings
+        # and concatenation more accurately than a regex pre-scan could
+        # (no false positives from string literals or comments). The
+        # shared parse cache hands back the same tree to any other
+        # check inspecting this file.
         try:
-            tree = ast.parse(content, filename=filepath)
+            tree = get_tree(filepath)
             checker = SQLInjectionChecker(filepath)
             checker.visit(tree)
             issues.extend(checker.issues)
@@ -107,7 +95,9 @@ def check_python_file(filepath: str) -> tuple[bool, List[str]]:
             # Skip files with syntax errors (other tools will catch this)
             pass
 
-        return len(issues) == 0, issues
+        is_safe = len(issues) == 0
+        cache.set(cache_key, (is_safe, issues))
+        return is_safe, issues
 
     except UnicodeDecodeError:
         return False, [f"{filepath}: File encoding error (expected UTF-8)"]
@@ -115,6 +105,27 @@ def check_python_file(filepath: str) -> tuple[bool, List[str]]:
         return False, [f"{filepath}: Error analyzing file: {e}"]
 
 
+def _prefetch(files: List[str]) -> None:
+    """Hint the kernel to read the given files ahead of the scan.
+
+    One cheap fadvise syscall per file lets the kernel batch and
+    overlap the reads before the worker processes touch them, hiding
+    most cold-cache I/O latency on large invocations. A no-op on
+    platforms without posix_fadvise.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for filepath in files:
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            continue
+
+
 def main() -> int:
     """Main entry point for SQL injection checking.
 
@@ -125,17 +136,37 @@ def main() -> int:
         print("Usage: check_sql_injection.py <file1.py> [file2.py ...]")
         return 1
 
-    all_safe = True
-    for filepath in sys.argv[1:]:
-        # Only check files likely to have SQL (skip test files for now)
-        if "test" in filepath.lower() or "__init__" in filepath:
-            continue
+    # Only check files likely to have SQL (skip test files for now)
+    files = [
+        filepath
+        for filepath in sys.argv[1:]
+        if "test" not in filepath.lower() and "__init__" not in filepath
+    ]
+    _prefetch(files)
+
+    # Typical interactive commits touch a file or two; only pay the
+    # worker-pool startup once there is at least a chunk per worker.
+    if len(files) <= 8:
+        results = [check_python_file(filepath) for filepath in files]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 8)
+        ) as executor:
+            results = list(
+                executor.map(check_python_file, files, chunksize=8)
+            )
 
-        is_safe, issues = check_python_file(filepath)
+    all_safe = True
+    out: List[str] = []
+    for is_safe, issues in results:
         if not is_safe:
             all_safe = False
             for issue in issues:
-                print(f"❌ {issue}")
+                out.append(f"❌ {issue}")
+
+    # Single buffered write for the whole report
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
     return 0 if all_safe else 1
 
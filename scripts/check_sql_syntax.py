@@ -4,7 +4,10 @@
 This script validates SQL files for basic syntax errors.
 """
 
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -14,6 +17,17 @@ except ImportError:
     print("Error: sqlparse not installed. Run: pip install sqlparse")
     sys.exit(1)
 
+# Common SQL injection patterns (basic), compiled once into a single
+# alternation so each statement is scanned in one case-insensitive pass
+# instead of one lowered-copy substring search per pattern.
+_DANGEROUS_RE = re.compile(
+    "|".join(
+        re.escape(pattern)
+        for pattern in ("exec(", "execute(", "eval(", "';", '";')
+    ),
+    re.IGNORECASE,
+)
+
 
 def check_sql_file(filepath: str) -> tuple[bool, List[str]]:
     """Check a SQL file for syntax errors.
@@ -26,38 +40,28 @@ def check_sql_file(filepath: str) -> tuple[bool, List[str]]:
     """
     errors = []
     try:
-        content = Path(filepath).read_text(encoding="utf-8")
-
-        # Parse SQL content
-        statements = sqlparse.parse(content)
-
-        if not statements:
-            errors.append(f"{filepath}: Empty or invalid SQL file")
-            return False, errors
-
-        # Check for basic syntax issues
-        for idx, statement in enumerate(statements, 1):
-            # Remove comments and whitespace
-            stripped = statement.value.strip()
-            if not stripped or stripped.startswith("--"):
-                continue
-
-            # Check for common SQL injection patterns (basic)
-            dangerous_patterns = [
-                "exec(",
-                "execute(",
-                "eval(",
-                "';",
-                '";',
-            ]
-
-            for pattern in dangerous_patterns:
-                if pattern.lower() in stripped.lower():
+        # parsestream yields statements lazily, keeping peak memory at
+        # one statement even for multi-megabyte migration scripts.
+        statement_count = 0
+        with Path(filepath).open(encoding="utf-8") as f:
+            for idx, statement in enumerate(sqlparse.parsestream(f), 1):
+                statement_count = idx
+
+                # Remove comments and whitespace
+                stripped = statement.value.strip()
+                if not stripped or stripped.startswith("--"):
+                    continue
+
+                for match in _DANGEROUS_RE.finditer(stripped):
                     errors.append(
                         f"{filepath}:{idx}: Potentially dangerous pattern "
-                        f"'{pattern}' found"
+                        f"'{match.group(0).lower()}' found"
                     )
 
+        if not statement_count:
+            errors.append(f"{filepath}: Empty or invalid SQL file")
+            return False, errors
+
         return len(errors) == 0, errors
 
     except UnicodeDecodeError:
@@ -78,15 +82,29 @@ def main() -> int:
         print("Usage: check_sql_syntax.py <file1.sql> [file2.sql ...]")
         return 1
 
+    files = sys.argv[1:]
+
+    # Run small batches inline; pool startup outweighs the parallelism
+    if len(files) <= 8:
+        results = [check_sql_file(filepath) for filepath in files]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 8)
+        ) as executor:
+            results = list(executor.map(check_sql_file, files, chunksize=8))
+
     all_valid = True
-    for filepath in sys.argv[1:]:
-        is_valid, errors = check_sql_file(filepath)
+    out: List[str] = []
+    for filepath, (is_valid, errors) in zip(files, results):
         if not is_valid:
             all_valid = False
             for error in errors:
-                print(f"❌ {error}")
+                out.append(f"❌ {error}")
         else:
-            print(f"✅ {filepath}: SQL syntax OK")
+            out.append(f"✅ {filepath}: SQL syntax OK")
+
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
     return 0 if all_valid else 1
 
@@ -3,112 +3,177 @@
 Validate Odoo 19 module structure and new features compliance.
 """
 import ast
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from _result_cache import hash_content
 
-REQUIRED_MANIFEST_KEYS = {
+
+REQUIRED_MANIFEST_KEYS = frozenset({
     'name',
     'version',
     'depends',
     'license',
     'author',  # Now required in Odoo 19
-}
+})
 
-ALLOWED_LICENSES = {
+ALLOWED_LICENSES = frozenset({
     'AGPL-3',
     'LGPL-3',
     'GPL-3',
     'Apache-2.0',
     'MIT',
     'Other proprietary',
-}
+})
 
-DEPRECATED_KEYS = {
+DEPRECATED_KEYS = frozenset({
     'active',        # Deprecated in Odoo 19
     'description',   # Use README.md instead
-}
+})
 
-REQUIRED_FILES = {
+REQUIRED_FILES = frozenset({
     '__init__.py',
     '__manifest__.py',
     'README.md',
     'LICENSE',  # More strictly enforced in Odoo 19
-}
+})
 
-RECOMMENDED_DIRS = {
+RECOMMENDED_DIRS = frozenset({
     'models',
     'views',
     'security',
     'data',
-}
+})
 
 # New in Odoo 19
-OWL_COMPONENT_STRUCTURE = {
+OWL_COMPONENT_STRUCTURE = frozenset({
     'static/src/components',
     'static/src/views',
     'static/src/xml',
-}
+})
 
+# Matches AI-related dependency names without allocating a lowered
+# copy of every depends entry
+_AI_DEP_RE = re.compile('ai', re.IGNORECASE)
+
+# Entry names expected directly under static/src
+_OWL_DIR_NAMES = frozenset(
+    path.rsplit('/', 1)[-1] for path in OWL_COMPONENT_STRUCTURE
+)
 
-def validate_manifest(manifest_path: Path) -> list[str]:
-    """Validate __manifest__.py for Odoo."""
-    errors = []
 
+def _list_dir(path: Path) -> set[str] | None:
+    """Return the entry names of a directory, or None if unreadable."""
     try:
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            manifest = ast.literal_eval(content)
-    except Exception as e:
-        return [f"Error parsing manifest: {e}"]
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return None
 
-    # Check required keys
-    missing_keys = REQUIRED_MANIFEST_KEYS - set(manifest.keys())
-    if missing_keys:
-        errors.append(f"Missing required keys: {missing_keys}")
 
-    # Check deprecated keys
-    deprecated_found = DEPRECATED_KEYS & set(manifest.keys())
-    if deprecated_found:
-        errors.append(
-            f"Deprecated keys found: {deprecated_found}. "
-            "Remove these keys from manifest."
-        )
+# Parsed manifests memoized by content hash, so identical content is
+# evaluated once per process (e.g. sibling modules sharing a template,
+# or repeated validation in a long-lived integration).
+_manifest_cache: dict[str, dict] = {}
+
+
+def _load_manifest(manifest_path: Path) -> dict:
+    """Parse a manifest file, memoized by its content hash."""
+    content = manifest_path.read_bytes()
+    key = hash_content(content)
+    manifest = _manifest_cache.get(key)
+    if manifest is None:
+        manifest = ast.literal_eval(content.decode('utf-8'))
+        _manifest_cache[key] = manifest
+    return manifest
+
 
-    # Validate license
-    license_key = manifest.get('license')
-    if license_key and license_key not in ALLOWED_LICENSES:
+def _check_license(value, _manifest: dict, errors: list[str]) -> None:
+    """Validate the license key against the allowed list."""
+    if value and value not in ALLOWED_LICENSES:
         errors.append(
-            f"Invalid license '{license_key}'. "
-            f"Must be one of: {ALLOWED_LICENSES}"
+            f"Invalid license '{value}'. "
+            f"Must be one of: {', '.join(sorted(ALLOWED_LICENSES))}"
         )
 
-    # Check version format (19.0.X.Y.Z)
-    version = manifest.get('version', '')
-    if not version.startswith('19.0.'):
+
+def _check_version(value, _manifest: dict, errors: list[str]) -> None:
+    """Check version format (19.0.X.Y.Z)."""
+    if not value.startswith('19.0.'):
         errors.append(
-            f"Version '{version}' must start with '19.0.' for Odoo"
+            f"Version '{value}' must start with '19.0.' for Odoo"
         )
 
-    parts = version.split('.')
+    parts = value.split('.')
     if len(parts) != 5:
         errors.append(
-            f"Version '{version}' should have format 19.0.X.Y.Z"
+            f"Version '{value}' should have format 19.0.X.Y.Z"
         )
 
-    # Check for AI-related dependencies if using AI features
-    if any('ai' in dep.lower() for dep in manifest.get('depends', [])):
-        if 'data' not in manifest or not any(
-            'server_action' in f for f in manifest.get('data', [])
-        ):
+
+def _check_depends(value, manifest: dict, errors: list[str]) -> None:
+    """Check for AI-related dependencies if using AI features."""
+    # Bind both lists once; 'or ()' also avoids allocating a default
+    # list and handles an explicit None value.
+    depends = value or ()
+    if any(_AI_DEP_RE.search(dep) for dep in depends):
+        data_files = manifest.get('data') or ()
+        if not any('server_action' in f for f in data_files):
             errors.append(
                 "Module uses AI dependencies but no AI server actions found"
             )
 
-    # Check installable flag
-    if not manifest.get('installable', True):
+
+def _check_installable(value, _manifest: dict, errors: list[str]) -> None:
+    """Check installable flag."""
+    if not value:
         errors.append("Module is marked as not installable")
 
+
+_VALIDATORS = {
+    'license': _check_license,
+    'version': _check_version,
+    'depends': _check_depends,
+    'installable': _check_installable,
+}
+
+
+def validate_manifest(manifest_path: Path) -> list[str]:
+    """Validate __manifest__.py for Odoo."""
+    errors = []
+
+    try:
+        manifest = _load_manifest(manifest_path)
+    except Exception as e:
+        return [f"Error parsing manifest: {e}"]
+
+    # dict.keys() is a set-like view, so the set ops below work on it
+    # directly without materializing an intermediate set.
+    manifest_keys = manifest.keys()
+
+    # Check required keys
+    missing_keys = REQUIRED_MANIFEST_KEYS - manifest_keys
+    if missing_keys:
+        errors.append(f"Missing required keys: {missing_keys}")
+
+    # Check deprecated keys
+    deprecated_found = DEPRECATED_KEYS & manifest_keys
+    if deprecated_found:
+        errors.append(
+            f"Deprecated keys found: {deprecated_found}. "
+            "Remove these keys from manifest."
+        )
+
+    # One pass over the items dispatches every per-key check, instead
+    # of a manifest.get() lookup per rule.
+    for key, value in manifest.items():
+        check = _VALIDATORS.get(key)
+        if check:
+            check(value, manifest, errors)
+
     return errors
 
 
@@ -116,48 +181,42 @@ def validate_odoo_structure(module_path: Path) -> list[str]:
     """Validate Odoo module directory structure."""
     errors = []
 
+    # A single scandir lists the whole module directory in one syscall
+    # instead of one stat per required file / recommended directory.
+    entries = _list_dir(module_path)
+    if entries is None:
+        return [f"Error reading module directory: {module_path}"]
+
     # Check required files
-    for required_file in REQUIRED_FILES:
-        file_path = module_path / required_file
-        if not file_path.exists():
-            errors.append(f"Missing required file: {required_file}")
+    for required_file in REQUIRED_FILES - entries:
+        errors.append(f"Missing required file: {required_file}")
 
     # Check README format
-    readme_path = module_path / 'README.md'
-    if readme_path.exists():
-        content = readme_path.read_text()
+    if 'README.md' in entries:
+        content = (module_path / 'README.md').read_text()
         if len(content) < 100:
             errors.append("README.md is too short (< 100 chars)")
 
     # Check for at least one content directory
-    has_content = any(
-        (module_path / dir_name).exists()
-        for dir_name in RECOMMENDED_DIRS
-    )
-
-    if not has_content:
+    if not RECOMMENDED_DIRS & entries:
         errors.append(
-            f"Module should have at least one of: {RECOMMENDED_DIRS}"
+            "Module should have at least one of: "
+            f"{', '.join(sorted(RECOMMENDED_DIRS))}"
         )
 
     # Check for OWL components structure (if using frontend)
-    static_src = module_path / 'static' / 'src'
-    if static_src.exists():
-        has_owl_structure = any(
-            (module_path / owl_dir).exists()
-            for owl_dir in OWL_COMPONENT_STRUCTURE
-        )
-        if not has_owl_structure:
+    if 'static' in entries:
+        src_children = _list_dir(module_path / 'static' / 'src')
+        if src_children is not None and not _OWL_DIR_NAMES & src_children:
             errors.append(
                 "Module has static/src but doesn't follow OWL structure. "
-                f"Expected one of: {OWL_COMPONENT_STRUCTURE}"
+                f"Expected one of: {', '.join(sorted(OWL_COMPONENT_STRUCTURE))}"
             )
 
     # Check security folder
-    security_path = module_path / 'security'
-    if security_path.exists():
-        has_ir_model_access = (security_path / 'ir.model.access.csv').exists()
-        if not has_ir_model_access:
+    if 'security' in entries:
+        security_children = _list_dir(module_path / 'security') or set()
+        if 'ir.model.access.csv' not in security_children:
             errors.append(
                 "security/ folder exists but no ir.model.access.csv found"
             )
@@ -165,27 +224,54 @@ def validate_odoo_structure(module_path: Path) -> list[str]:
     return errors
 
 
+def validate_module(manifest_path: Path) -> list[str]:
+    """Run all validations for the module owning the given manifest."""
+    errors = []
+    # One broken module must not abort the rest of the batch
+    try:
+        errors.extend(validate_manifest(manifest_path))
+        errors.extend(validate_odoo_structure(manifest_path.parent))
+    except Exception as e:
+        errors.append(f"Internal error validating module: {e}")
+    return errors
+
+
 def main():
     """Main validation function."""
     if len(sys.argv) < 2:
-        print("Usage: validate_odoo19_structure.py <manifest_path>")
+        print("Usage: validate_odoo19_structure.py <manifest_path> [...]")
         sys.exit(1)
 
-    manifest_path = Path(sys.argv[1])
-    module_path = manifest_path.parent
+    manifest_paths = [Path(arg) for arg in sys.argv[1:]]
+
+    # Validate small batches inline; the pool only pays off at scale
+    if len(manifest_paths) <= 8:
+        results = [validate_module(path) for path in manifest_paths]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 8)
+        ) as executor:
+            results = list(
+                executor.map(validate_module, manifest_paths, chunksize=8)
+            )
 
-    errors = []
-    errors.extend(validate_manifest_19(manifest_path))
-    errors.extend(validate_odoo_structure(module_path))
+    all_valid = True
+    out: list[str] = []
+    for manifest_path, errors in zip(manifest_paths, results):
+        module_path = manifest_path.parent
+        if errors:
+            all_valid = False
+            out.append(
+                f"\n❌ Validation failed for {module_path.name} (Odoo):"
+            )
+            out.extend(f"  - {error}" for error in errors)
+        else:
+            out.append(f"✅ Module {module_path.name} is Odoo compliant")
 
-    if errors:
-        print(f"\n❌ Validation failed for {module_path.name} (Odoo):")
-        for error in errors:
-            print(f"  - {error}")
-        sys.exit(1)
+    if out:
+        sys.stdout.write('\n'.join(out) + '\n')
 
-    print(f"✅ Module {module_path.name} is Odoo compliant")
-    sys.exit(0)
+    sys.exit(0 if all_valid else 1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,42 @@
+"""Tests for scripts/validate_odoo_structure.py."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from validate_odoo_structure import validate_module  # noqa: E402
+
+
+def _make_compliant_module(tmp_path: Path) -> Path:
+    """Create a minimal compliant Odoo module; return its manifest path."""
+    (tmp_path / "models").mkdir()
+    (tmp_path / "__init__.py").touch()
+    (tmp_path / "LICENSE").touch()
+    (tmp_path / "README.md").write_text("x" * 120)
+    manifest = tmp_path / "__manifest__.py"
+    manifest.write_text(
+        "{\n"
+        "    'name': 'Test Module',\n"
+        "    'version': '19.0.1.0.0',\n"
+        "    'depends': ['base'],\n"
+        "    'license': 'LGPL-3',\n"
+        "    'author': 'OCA',\n"
+        "}\n"
+    )
+    return manifest
+
+
+def test_validate_module_compliant(tmp_path: Path) -> None:
+    """A compliant module validates cleanly (and without raising)."""
+    manifest = _make_compliant_module(tmp_path)
+    assert validate_module(manifest) == []
+
+
+def test_validate_module_reports_errors(tmp_path: Path) -> None:
+    """A bare manifest yields validation errors, not an exception."""
+    manifest = tmp_path / "__manifest__.py"
+    manifest.write_text("{'name': 'Bare'}")
+    errors = validate_module(manifest)
+    assert errors
+    assert any("Missing required keys" in error for error in errors)